@@ -3,31 +3,49 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 import fnmatch
+import functools
+import hashlib
 import json
 import os
+import random
+import re
+import ssl
 import sys
 import time
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Mapping, Optional, Tuple, Union
 from urllib.parse import urlparse
 
-import requests
+import aiohttp
 from cryptography import x509
-from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import dsa, ec, rsa
+from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
 from cryptography.x509.oid import NameOID
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to the stdlib encoder.
+    orjson = None
+
 DEFAULT_CERT_DIR = "/certs"
 DEFAULT_THRESHOLD_DAYS = 20
 DEFAULT_MAX_RETRIES = 1
 DEFAULT_RETRY_DELAY = 5
+MAX_RETRY_BACKOFF = 60
+
+_WILDCARD_CHARS = frozenset("*?[")
 
 LOG_LEVELS = {"debug": 10, "info": 20, "warn": 30, "error": 40}
 LOG_LEVEL = LOG_LEVELS.get(os.getenv("LOG_LEVEL", "info").lower(), 20)
 LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
 
+_last_ts_sec = -1
+_last_ts_str = ""
+
 
 class ConfigError(Exception):
     """Raised when configuration is invalid."""
@@ -36,7 +54,7 @@ class ConfigError(Exception):
 @dataclass
 class Config:
     api_url: str
-    node_name: str
+    node_names: List[str]
     token_id: str
     token_secret: str
     cert_dir: str = DEFAULT_CERT_DIR
@@ -54,17 +72,19 @@ class Config:
     retry_delay_seconds: int = DEFAULT_RETRY_DELAY
 
     @classmethod
-    def from_env(cls) -> "Config":
-        env = os.environ
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> "Config":
+        if env is None:
+            env = os.environ.copy()
         api_url = env.get("PROXMOX_API_URL", "").strip()
-        node_name = env.get("PROXMOX_NODE_NAME", "").strip()
+        node_names_env = env.get("PROXMOX_NODE_NAMES", "") or env.get("PROXMOX_NODE_NAME", "")
+        node_names = [n.strip() for n in node_names_env.split(",") if n.strip()]
         token_id = env.get("PROXMOX_TOKEN_ID", "").strip()
         token_secret = env.get("PROXMOX_TOKEN_SECRET", "").strip()
 
         if not api_url:
             raise ConfigError("PROXMOX_API_URL is required")
-        if not node_name:
-            raise ConfigError("PROXMOX_NODE_NAME is required")
+        if not node_names:
+            raise ConfigError("PROXMOX_NODE_NAME or PROXMOX_NODE_NAMES is required")
         if not token_id:
             raise ConfigError("PROXMOX_TOKEN_ID is required")
         if not token_secret:
@@ -74,15 +94,15 @@ class Config:
         include_ca_bundle = _parse_bool(env.get("INCLUDE_CA_BUNDLE", "true"))
         verify_tls = _parse_bool(env.get("VERIFY_TLS", "true"))
         ca_bundle_path = env.get("CA_BUNDLE_PATH") or None
-        min_validity_days = int(env.get("MIN_VALIDITY_DAYS", DEFAULT_THRESHOLD_DAYS))
+        min_validity_days = _env_int(env, "MIN_VALIDITY_DAYS", DEFAULT_THRESHOLD_DAYS)
         dry_run = _parse_bool(env.get("DRY_RUN", "false"))
         services_raw = env.get("SERVICES_TO_RESTART", "")
         services_to_restart = [s.strip() for s in services_raw.split(",") if s.strip()] or ["pveproxy"]
         poll_task = _parse_bool(env.get("POLL_TASK", "true"))
-        poll_interval_seconds = int(env.get("POLL_INTERVAL_SECONDS", "2"))
-        poll_timeout_seconds = int(env.get("POLL_TIMEOUT_SECONDS", "60"))
-        max_retries = int(env.get("MAX_RETRIES", DEFAULT_MAX_RETRIES))
-        retry_delay_seconds = int(env.get("RETRY_DELAY_SECONDS", DEFAULT_RETRY_DELAY))
+        poll_interval_seconds = _env_int(env, "POLL_INTERVAL_SECONDS", 2)
+        poll_timeout_seconds = _env_int(env, "POLL_TIMEOUT_SECONDS", 60)
+        max_retries = _env_int(env, "MAX_RETRIES", DEFAULT_MAX_RETRIES)
+        retry_delay_seconds = _env_int(env, "RETRY_DELAY_SECONDS", DEFAULT_RETRY_DELAY)
 
         expected_hosts_env = env.get("EXPECTED_HOSTNAMES", "").strip()
         expected_hostnames = [h.strip() for h in expected_hosts_env.split(",") if h.strip()]
@@ -93,7 +113,7 @@ class Config:
 
         return cls(
             api_url=api_url.rstrip("/"),
-            node_name=node_name,
+            node_names=node_names,
             token_id=token_id,
             token_secret=token_secret,
             cert_dir=cert_dir,
@@ -116,19 +136,45 @@ def _parse_bool(value: str) -> bool:
     return value.lower() in {"1", "true", "yes", "on"}
 
 
+def _env_int(env: Mapping[str, str], key: str, default: int) -> int:
+    value = env.get(key, "").strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError as exc:
+        raise ConfigError(f"{key} must be an integer, got {value!r}") from exc
+
+
 def _should_log(level: str) -> bool:
     return LOG_LEVELS.get(level, 20) >= LOG_LEVEL
 
 
+def _timestamp() -> str:
+    # Log timestamps have second resolution, so format at most once per second.
+    global _last_ts_sec, _last_ts_str
+    sec = int(time.time())
+    if sec != _last_ts_sec:
+        _last_ts_sec = sec
+        _last_ts_str = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(sec))
+    return _last_ts_str
+
+
+def _json_dumps(value) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value)
+
+
 def _log(level: str, message: str, **fields) -> None:
     if not _should_log(level):
         return
-    payload = {"ts": datetime.datetime.utcnow().isoformat() + "Z", "level": level, "msg": message}
+    payload = {"ts": _timestamp(), "level": level, "msg": message}
     payload.update(fields)
     if LOG_FORMAT == "json":
-        print(json.dumps(payload))
+        print(_json_dumps(payload))
     else:
-        print(" ".join(f"{key}={json.dumps(value)}" for key, value in payload.items()))
+        print(" ".join(f"{key}={_json_dumps(value)}" for key, value in payload.items()))
 
 
 def _read_file(path: str) -> bytes:
@@ -139,7 +185,16 @@ def _read_file(path: str) -> bytes:
         raise ConfigError(f"Required file missing: {path}") from exc
 
 
-def _validate_certificate_pair(cert_pem: bytes, key_pem: bytes, expected_hosts: List[str], min_valid_days: int) -> None:
+def _read_file_optional(path: str) -> Optional[bytes]:
+    try:
+        return _read_file(path)
+    except ConfigError:
+        return None
+
+
+def _validate_certificate_pair(
+    cert_pem: bytes, key_pem: bytes, expected_hosts: List[str], min_valid_days: int
+) -> Tuple[x509.Certificate, PrivateKeyTypes]:
     certificate = x509.load_pem_x509_certificate(cert_pem)
     private_key = serialization.load_pem_private_key(key_pem, password=None)
 
@@ -162,13 +217,13 @@ def _validate_certificate_pair(cert_pem: bytes, key_pem: bytes, expected_hosts:
     if expected_hosts and not _certificate_covers_hosts(certificate, expected_hosts):
         raise ConfigError("Certificate does not cover required hostnames")
 
+    return certificate, private_key
+
 
 def _public_keys_match(cert_key, private_key) -> bool:
-    if isinstance(cert_key, rsa.RSAPublicKey) and isinstance(private_key, rsa.RSAPublicKey):
-        return cert_key.public_numbers() == private_key.public_numbers()
-    if isinstance(cert_key, ec.EllipticCurvePublicKey) and isinstance(private_key, ec.EllipticCurvePublicKey):
-        return cert_key.public_numbers() == private_key.public_numbers()
-    if isinstance(cert_key, dsa.DSAPublicKey) and isinstance(private_key, dsa.DSAPublicKey):
+    if type(cert_key) is not type(private_key):
+        return False
+    if isinstance(cert_key, (rsa.RSAPublicKey, ec.EllipticCurvePublicKey, dsa.DSAPublicKey)):
         return cert_key.public_numbers() == private_key.public_numbers()
     return False
 
@@ -185,89 +240,143 @@ def _certificate_covers_hosts(certificate: x509.Certificate, expected_hosts: Lis
     for attribute in common_names:
         names.append(attribute.value)
 
-    normalized = [name.lower() for name in names]
+    normalized = {name.lower() for name in names}
+    exact_names = {name for name in normalized if not _WILDCARD_CHARS & set(name)}
+    # Fold every wildcard pattern into one alternation so each host costs a single regex match.
+    wildcard_names = sorted(normalized - exact_names)
+    wildcard_pattern = (
+        re.compile("|".join(f"(?:{fnmatch.translate(name)})" for name in wildcard_names)) if wildcard_names else None
+    )
     for host in expected_hosts:
         host_lower = host.lower()
-        if not any(fnmatch.fnmatch(host_lower, pattern) for pattern in normalized):
+        if host_lower in exact_names:
+            continue
+        if wildcard_pattern is None or not wildcard_pattern.match(host_lower):
             return False
     return True
 
 
-def _build_session(config: Config) -> requests.Session:
-    session = requests.Session()
-    session.headers.update(
-        {
+@functools.lru_cache(maxsize=None)
+def _load_ssl_context(ca_bundle_path: Optional[str], verify_tls: bool) -> Union[ssl.SSLContext, bool]:
+    # The CA store is parsed once per process and shared by every connection that uses it.
+    if ca_bundle_path:
+        return ssl.create_default_context(cafile=ca_bundle_path)
+    if not verify_tls:
+        return False
+    return ssl.create_default_context()
+
+
+def _build_session(config: Config) -> aiohttp.ClientSession:
+    # Size the pool to the widest fan-out (every service restart plus the certificates/info check,
+    # on every node) and keep idle connections alive across poll intervals so requests reuse
+    # established TLS sessions.
+    connector = aiohttp.TCPConnector(
+        ssl=_load_ssl_context(config.ca_bundle_path, config.verify_tls),
+        limit_per_host=len(config.node_names) * (len(config.services_to_restart) + 1),
+        keepalive_timeout=max(15, config.poll_interval_seconds + 5),
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={
             "Authorization": f"PVEAPIToken={config.token_id}={config.token_secret}",
             "User-Agent": "proxmox-cert-sync/1.0",
-        }
+        },
     )
-    if config.ca_bundle_path:
-        session.verify = config.ca_bundle_path
-    else:
-        session.verify = config.verify_tls
-    return session
 
 
-def _upload_certificate(session: requests.Session, config: Config, cert_pem: bytes, key_pem: bytes, ca_pem: Optional[bytes]) -> Optional[str]:
-    bundle = cert_pem
+async def _upload_certificate(
+    session: aiohttp.ClientSession,
+    config: Config,
+    node: str,
+    cert_pem: bytes,
+    key_pem: bytes,
+    ca_pem: Optional[bytes],
+) -> Optional[str]:
+    parts = [cert_pem]
     if ca_pem and config.include_ca_bundle:
-        bundle += b"\n" + ca_pem.strip() + b"\n"
+        parts.extend((b"\n", ca_pem.strip(), b"\n"))
+    bundle = b"".join(parts)
 
-    url = f"{config.api_url}/api2/json/nodes/{config.node_name}/certificates/custom"
+    url = f"{config.api_url}/api2/json/nodes/{node}/certificates/custom"
     data = {
         "certificates": bundle.decode("utf-8"),
         "key": key_pem.decode("utf-8"),
         "force": 1,
     }
-    response = session.post(url, data=data, timeout=30)
-    if response.status_code >= 400:
-        raise RuntimeError(f"Certificate upload failed: HTTP {response.status_code} {response.text}")
+    async with session.post(url, data=data, timeout=aiohttp.ClientTimeout(total=30)) as response:
+        if response.status >= 400:
+            raise RuntimeError(f"Certificate upload failed: HTTP {response.status} {await response.text()}")
+        payload = await response.json(content_type=None)
 
-    payload = response.json()
     task_id = None
     if isinstance(payload.get("data"), str):
         task_id = payload["data"]
 
-    _log("info", "Certificate upload request sent", task_id=task_id)
+    _log("info", "Certificate upload request sent", node=node, task_id=task_id)
     return task_id
 
 
-def _poll_task(session: requests.Session, config: Config, task_id: str) -> None:
+async def _poll_task_async(session: aiohttp.ClientSession, config: Config, node: str, task_id: str) -> None:
     deadline = time.time() + config.poll_timeout_seconds
-    url = f"{config.api_url}/api2/json/nodes/{config.node_name}/tasks/{task_id}/status"
+    url = f"{config.api_url}/api2/json/nodes/{node}/tasks/{task_id}/status"
     while time.time() < deadline:
-        response = session.get(url, timeout=15)
-        if response.status_code >= 400:
-            raise RuntimeError(f"Task status fetch failed: HTTP {response.status_code} {response.text}")
-        data = response.json().get("data") or {}
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
+            if response.status >= 400:
+                raise RuntimeError(f"Task status fetch failed: HTTP {response.status} {await response.text()}")
+            data = (await response.json(content_type=None)).get("data") or {}
         status = data.get("status")
         exitstatus = data.get("exitstatus")
         if status == "stopped":
             if exitstatus == "OK":
-                _log("info", "Certificate upload task completed", task_id=task_id)
+                _log("info", "Certificate upload task completed", node=node, task_id=task_id)
                 return
             raise RuntimeError(f"Certificate upload task failed: {exitstatus}")
-        time.sleep(config.poll_interval_seconds)
+        await asyncio.sleep(config.poll_interval_seconds)
     raise RuntimeError("Timed out waiting for certificate upload task to complete")
 
 
-def _restart_services(session: requests.Session, config: Config) -> None:
-    for service in config.services_to_restart:
-        url = f"{config.api_url}/api2/json/nodes/{config.node_name}/services/{service}/restart"
+async def _restart_service(session: aiohttp.ClientSession, config: Config, node: str, service: str) -> None:
+    url = f"{config.api_url}/api2/json/nodes/{node}/services/{service}/restart"
+    try:
         # Proxmox expects a POST for service restarts; PUT returns 501 on recent releases.
-        response = session.post(url, timeout=15)
-        if response.status_code >= 400:
-            raise RuntimeError(f"Failed to restart service {service}: HTTP {response.status_code} {response.text}")
-        _log("info", "Service restart requested", service=service)
+        async with session.post(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
+            if response.status >= 400:
+                raise RuntimeError(
+                    f"Failed to restart service {service}: HTTP {response.status} {await response.text()}"
+                )
+    except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+        raise RuntimeError(f"Failed to restart service {service}: {str(exc) or repr(exc)}") from exc
+    _log("info", "Service restart requested", node=node, service=service)
+
+
+async def _restart_services(session: aiohttp.ClientSession, config: Config, node: str) -> None:
+    # Service restarts are independent, so issue them concurrently.
+    results = await asyncio.gather(
+        *(_restart_service(session, config, node, service) for service in config.services_to_restart),
+        return_exceptions=True,
+    )
+    failures = [str(result) or repr(result) for result in results if isinstance(result, BaseException)]
+    if failures:
+        raise RuntimeError("; ".join(failures))
 
 
-def _verify_remote_certificate(session: requests.Session, config: Config) -> None:
-    url = f"{config.api_url}/api2/json/nodes/{config.node_name}/certificates/info"
-    response = session.get(url, timeout=15)
-    if response.status_code >= 400:
-        _log("warn", "Unable to verify remote certificate", http_status=response.status_code)
-        return
-    payload = response.json().get("data")
+def _normalize_fingerprint(value: str) -> str:
+    return value.replace(":", "").strip().upper()
+
+
+def _certificate_fingerprint(certificate: x509.Certificate) -> str:
+    return certificate.fingerprint(hashes.SHA256()).hex().upper()
+
+
+async def _fetch_remote_certificate(
+    session: aiohttp.ClientSession, config: Config, node: str
+) -> Tuple[Optional[str], Optional[int]]:
+    url = f"{config.api_url}/api2/json/nodes/{node}/certificates/info"
+    async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
+        if response.status >= 400:
+            _log("warn", "Unable to fetch remote certificate", node=node, http_status=response.status)
+            return None, None
+        payload = (await response.json(content_type=None)).get("data")
     info: dict = {}
     if isinstance(payload, dict):
         info = payload
@@ -280,26 +389,184 @@ def _verify_remote_certificate(session: requests.Session, config: Config) -> Non
             info = payload[0] if payload and isinstance(payload[0], dict) else {}
     fingerprint = info.get("fingerprint")
     not_after = info.get("notafter")
-    _log("info", "Remote certificate state", fingerprint=fingerprint, not_after=not_after)
+    _log("info", "Remote certificate state", node=node, fingerprint=fingerprint, not_after=not_after)
+    return fingerprint, not_after
+
+
+async def _fetch_served_fingerprint(config: Config) -> Optional[str]:
+    # certificates/info describes the file on disk; the TLS handshake shows what pveproxy serves.
+    # aiohttp releases pooled connections before the peer certificate can be read, so use our own.
+    parsed = urlparse(config.api_url)
+    if parsed.scheme != "https" or not parsed.hostname:
+        return None
+    ssl_context = _load_ssl_context(config.ca_bundle_path, config.verify_tls)
+    if not isinstance(ssl_context, ssl.SSLContext):
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+    _reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(
+            parsed.hostname, parsed.port or 443, ssl=ssl_context, server_hostname=parsed.hostname
+        ),
+        timeout=15,
+    )
+    try:
+        ssl_object = writer.get_extra_info("ssl_object")
+        der = ssl_object.getpeercert(binary_form=True) if ssl_object else None
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+    if not der:
+        return None
+    return hashlib.sha256(der).hexdigest().upper()
+
+
+async def _verify_remote_certificate(
+    session: aiohttp.ClientSession, config: Config, node: str, certificate: x509.Certificate
+) -> None:
+    fingerprint, _not_after = await _fetch_remote_certificate(session, config, node)
+    if not fingerprint:
+        _log("warn", "Remote certificate fingerprint unavailable; skipping comparison", node=node)
+        return
+    if _normalize_fingerprint(fingerprint) != _certificate_fingerprint(certificate):
+        raise RuntimeError(
+            f"Remote certificate fingerprint {fingerprint} does not match uploaded certificate"
+        )
 
 
-def main() -> int:
+async def _sync_node(
+    session: aiohttp.ClientSession,
+    config: Config,
+    node: str,
+    cert_pem: bytes,
+    key_pem: bytes,
+    ca_pem: Optional[bytes],
+    certificate: x509.Certificate,
+) -> None:
     try:
-        config = Config.from_env()
+        fingerprint, not_after = await _fetch_remote_certificate(session, config, node)
+    except Exception as exc:  # noqa: BLE001
+        _log("warn", "Unable to fetch remote certificate", node=node, error=str(exc))
+        fingerprint, not_after = None, None
+    local_fingerprint = _certificate_fingerprint(certificate)
+    threshold = time.time() + config.min_validity_days * 86400
+    upload_needed = not (
+        fingerprint
+        and _normalize_fingerprint(fingerprint) == local_fingerprint
+        and isinstance(not_after, (int, float))
+        and not_after > threshold
+    )
+    if not upload_needed:
+        # A matching file does not prove pveproxy picked it up (a previous restart may have failed).
+        # Only the node behind the API URL can be checked directly; other nodes are restarted.
+        served_fingerprint = None
+        if node == _api_host_node(config):
+            try:
+                served_fingerprint = await _fetch_served_fingerprint(config)
+            except Exception as exc:  # noqa: BLE001
+                _log("warn", "Unable to fetch served certificate", node=node, error=str(exc))
+        if served_fingerprint == local_fingerprint:
+            _log("info", "Certificate up to date; skipping upload", node=node)
+            return
+        _log("info", "Certificate file up to date; skipping upload but restarting services", node=node)
+
+    attempt = 0
+    while True:
+        try:
+            if upload_needed:
+                task_id = await _upload_certificate(session, config, node, cert_pem, key_pem, ca_pem)
+                if task_id and config.poll_task:
+                    await _poll_task_async(session, config, node, task_id)
+            steps = {"restart": _restart_services(session, config, node)}
+            if upload_needed:
+                # certificates/info reads the uploaded file, so verification need not wait for restarts.
+                # Without an upload, the pre-check above already confirmed the file's fingerprint.
+                steps["verify"] = _verify_remote_certificate(session, config, node, certificate)
+            results = await asyncio.gather(*steps.values(), return_exceptions=True)
+            failures = [
+                f"{step}: {str(result) or repr(result)}"
+                for step, result in zip(steps, results)
+                if isinstance(result, BaseException)
+            ]
+            if failures:
+                raise RuntimeError("; ".join(failures))
+            _log("info", "Certificate sync completed", node=node)
+            return
+        except Exception as exc:  # noqa: BLE001
+            attempt += 1
+            _log("error", "Sync attempt failed", node=node, attempt=attempt, error=str(exc))
+            if attempt > config.max_retries:
+                raise
+            # Exponential backoff with jitter keeps concurrently scheduled jobs from retrying in lockstep.
+            backoff = min(MAX_RETRY_BACKOFF, config.retry_delay_seconds * 2 ** (attempt - 1))
+            await asyncio.sleep(backoff * random.uniform(0.5, 1.5))
+
+
+def _api_host_node(config: Config) -> Optional[str]:
+    # Nodes are conventionally named after the short hostname that serves them.
+    hostname = urlparse(config.api_url).hostname or ""
+    short_name = hostname.split(".")[0].lower()
+    for node in config.node_names:
+        if node.lower() == short_name:
+            return node
+    return None
+
+
+async def _run(
+    config: Config, cert_pem: bytes, key_pem: bytes, ca_pem: Optional[bytes], certificate: x509.Certificate
+) -> int:
+    # Every node is reached through the API host, and restarting pveproxy there drops in-flight
+    # requests for the other nodes. Sync the remaining nodes concurrently first, then the API host.
+    api_node = _api_host_node(config)
+    other_nodes = [node for node in config.node_names if node != api_node]
+    async with _build_session(config) as session:
+        results = await asyncio.gather(
+            *(_sync_node(session, config, node, cert_pem, key_pem, ca_pem, certificate) for node in other_nodes),
+            return_exceptions=True,
+        )
+        nodes = list(other_nodes)
+        if api_node is not None:
+            results.extend(
+                await asyncio.gather(
+                    _sync_node(session, config, api_node, cert_pem, key_pem, ca_pem, certificate),
+                    return_exceptions=True,
+                )
+            )
+            nodes.append(api_node)
+
+    failed_nodes = [node for node, result in zip(nodes, results) if isinstance(result, BaseException)]
+    if failed_nodes:
+        _log("error", "Certificate sync failed", nodes=failed_nodes)
+        return 1
+    return 0
+
+
+async def _main() -> int:
+    env = os.environ.copy()
+    try:
+        config = Config.from_env(env)
     except ConfigError as exc:
         _log("error", "Configuration error", error=str(exc))
         return 2
 
-    cert_path = os.path.join(config.cert_dir, os.environ.get("TLS_CERT_KEY", "tls.crt"))
-    key_path = os.path.join(config.cert_dir, os.environ.get("TLS_KEY_KEY", "tls.key"))
-    ca_path = os.path.join(config.cert_dir, os.environ.get("TLS_CA_KEY", "ca.crt"))
+    cert_path = os.path.join(config.cert_dir, env.get("TLS_CERT_KEY", "tls.crt"))
+    key_path = os.path.join(config.cert_dir, env.get("TLS_KEY_KEY", "tls.key"))
+    ca_path = os.path.join(config.cert_dir, env.get("TLS_CA_KEY", "ca.crt"))
 
     try:
-        cert_pem = _read_file(cert_path)
-        key_pem = _read_file(key_path)
-        ca_pem = _read_file(ca_path) if os.path.exists(ca_path) else None
+        # Read the TLS material concurrently; projected or network-backed volumes can stall on open().
+        cert_pem, key_pem, ca_pem = await asyncio.gather(
+            asyncio.to_thread(_read_file, cert_path),
+            asyncio.to_thread(_read_file, key_path),
+            asyncio.to_thread(_read_file_optional, ca_path),
+        )
 
-        _validate_certificate_pair(cert_pem, key_pem, config.expected_hostnames, config.min_validity_days)
+        certificate, _private_key = _validate_certificate_pair(
+            cert_pem, key_pem, config.expected_hostnames, config.min_validity_days
+        )
         _log("info", "Certificate validation succeeded")
     except ConfigError as exc:
         _log("error", "Validation failure", error=str(exc))
@@ -312,26 +579,11 @@ def main() -> int:
         _log("info", "Dry run complete; skipping upload")
         return 0
 
-    session = _build_session(config)
+    return await _run(config, cert_pem, key_pem, ca_pem, certificate)
 
-    attempt = 0
-    while attempt <= config.max_retries:
-        try:
-            task_id = _upload_certificate(session, config, cert_pem, key_pem, ca_pem)
-            if task_id and config.poll_task:
-                _poll_task(session, config, task_id)
-            _restart_services(session, config)
-            _verify_remote_certificate(session, config)
-            _log("info", "Certificate sync completed")
-            return 0
-        except Exception as exc:  # noqa: BLE001
-            attempt += 1
-            _log("error", "Sync attempt failed", attempt=attempt, error=str(exc))
-            if attempt > config.max_retries:
-                break
-            time.sleep(config.retry_delay_seconds * attempt)
 
-    return 1
+def main() -> int:
+    return asyncio.run(_main())
 
 
 if __name__ == "__main__":